@@ -2,6 +2,7 @@ import os  # for file and directory operations
 import json  # for parsing JSON data
 import csv  # for writing extraCardInfo to a CSV
 import requests  # for HTTP requests to download images
+import numpy as np  # for the typed columnar stats export
 from collections import Counter  # to count occurrences of card titles
 
 # Base directory for all card-related files
@@ -10,6 +11,7 @@ CARDS_TXT = os.path.join(CARDS_DIR, 'cards.txt')
 CARDS_JSON = os.path.join(CARDS_DIR, 'cards.json')
 OUTPUT_MD = os.path.join(CARDS_DIR, 'cube.md')
 OUTPUT_CSV = os.path.join(CARDS_DIR, 'cube_stats.csv')
+OUTPUT_NPY_DIR = os.path.join(CARDS_DIR, 'cube_stats')  # one .npy file per column
 LOG_FILE = os.path.join(CARDS_DIR, 'cube.log')
 
 # Count all card titles (including duplicates)
@@ -58,6 +60,21 @@ for sub in os.listdir(CARDS_DIR):
 markdown_rows = []  # Markdown rows (House, CardTitle, Nr of Copies, Link)
 csv_rows = []  # CSV rows for stats
 
+# Columnar data for the .npy export (one entry per card, same order as csv_rows)
+STAT_KEYS = [
+    'amberControl', 'expectedAmber', 'artifactControl',
+    'creatureControl', 'efficiency', 'recursion'
+]
+col_ids = []
+col_titles = []
+col_houses = []
+col_copies = []
+col_tokens = []
+col_stats = []
+trait_entries = []  # (row, trait) pairs
+synergy_entries = []  # (row, trait, rating, house condition) tuples
+SYNERGY_HOUSE_CONDITIONS = ['anyHouse', 'house', 'outOfHouse']
+
 # Process each card in the JSON
 for card in cards:
     title = card.get('cardTitle')
@@ -119,6 +136,30 @@ for card in cards:
         fmt(card.get('extraCardInfo.recursion', ''))
     ])
 
+    # Collect typed values for the columnar export
+    row = len(col_titles)
+    col_ids.append(str(card.get('id', '')))
+    col_titles.append(title)
+    col_houses.append(house)
+    col_copies.append(count)
+    col_tokens.append(bool(is_token))
+    # Missing stats stay NaN (the CSV leaves them blank); only real zeros are 0.0
+    col_stats.append([
+        np.nan if card.get(f'extraCardInfo.{k}') in (None, '') else float(card[f'extraCardInfo.{k}'])
+        for k in STAT_KEYS
+    ])
+    for trait in card.get('extraCardInfo.traits', []) or []:
+        if trait.get('trait'):
+            trait_entries.append((row, trait['trait']))
+    for synergy in card.get('extraCardInfo.synergies', []) or []:
+        if synergy.get('trait'):
+            synergy_entries.append((
+                row,
+                synergy['trait'],
+                float(synergy.get('rating', 0) or 0),
+                synergy.get('house', 'anyHouse')
+            ))
+
 # Sort markdown table by house
 markdown_rows.sort(key=lambda x: (x[0], x[1]))
 
@@ -138,4 +179,44 @@ with open(OUTPUT_CSV, 'w', encoding='utf-8', newline='') as csv_file:
     ])
     writer.writerows(csv_rows)
 
-print("Done: cube.md and cube_stats.csv written. Images and log updated.")
\ No newline at end of file
+# Write typed columnar export: houses as categorical codes, traits and
+# synergies as sparse COO matrices (rows = card index, cols = trait index).
+# Each synergy entry also carries its house condition as a categorical code, so
+# select one condition (synergy_house_codes == k) before densifying.
+house_names, house_codes = np.unique(np.array(col_houses, dtype=str), return_inverse=True)
+trait_names = sorted({t for _, t in trait_entries})
+trait_index = {t: i for i, t in enumerate(trait_names)}
+synergy_names = sorted({t for _, t, _, _ in synergy_entries})
+synergy_house_names = SYNERGY_HOUSE_CONDITIONS + sorted(
+    {c for _, _, _, c in synergy_entries} - set(SYNERGY_HOUSE_CONDITIONS)
+)
+synergy_house_index = {c: i for i, c in enumerate(synergy_house_names)}
+synergy_index = {t: i for i, t in enumerate(synergy_names)}
+
+columns = dict(
+    card_ids=np.array(col_ids, dtype=str),
+    card_titles=np.array(col_titles, dtype=str),
+    house_names=house_names,
+    house_codes=house_codes.astype(np.int8),
+    copies=np.array(col_copies, dtype=np.int16),
+    is_token=np.array(col_tokens, dtype=bool),
+    stat_names=np.array(STAT_KEYS, dtype=str),
+    stats=np.array(col_stats, dtype=np.float64).reshape(-1, len(STAT_KEYS)),
+    trait_names=np.array(trait_names, dtype=str),
+    trait_rows=np.array([r for r, _ in trait_entries], dtype=np.int32),
+    trait_cols=np.array([trait_index[t] for _, t in trait_entries], dtype=np.int32),
+    trait_data=np.ones(len(trait_entries), dtype=np.float32),
+    synergy_names=np.array(synergy_names, dtype=str),
+    synergy_rows=np.array([r for r, _, _, _ in synergy_entries], dtype=np.int32),
+    synergy_cols=np.array([synergy_index[t] for _, t, _, _ in synergy_entries], dtype=np.int32),
+    synergy_data=np.array([v for _, _, v, _ in synergy_entries], dtype=np.float32),
+    synergy_house_names=np.array(synergy_house_names, dtype=str),
+    synergy_house_codes=np.array([synergy_house_index[c] for _, _, _, c in synergy_entries], dtype=np.int8),
+)
+
+# Uncompressed .npy files so consumers can np.load(..., mmap_mode='r') without copying
+os.makedirs(OUTPUT_NPY_DIR, exist_ok=True)
+for name, values in columns.items():
+    np.save(os.path.join(OUTPUT_NPY_DIR, f"{name}.npy"), values)
+
+print("Done: cube.md, cube_stats.csv and cube_stats/*.npy written. Images and log updated.")
\ No newline at end of file
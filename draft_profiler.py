@@ -0,0 +1,119 @@
+import sys
+import json
+import tracemalloc
+from contextlib import contextmanager
+
+try:
+    import resource  # for peak RSS (not available on Windows)
+except ImportError:
+    resource = None
+
+# Frames from the profiler itself are excluded from snapshot statistics
+_SNAPSHOT_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+
+def peak_rss_kb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+# Opt-in memory instrumentation for batches of drafts.
+# Every stage records how many bytes it left allocated (net, inclusive of nested
+# stages). Every `sample_every` drafts a tracemalloc snapshot is taken and the top
+# allocation sites, the growth since the previous sample, the traced peak of that
+# window and the peak RSS (plus its growth since the previous sample) are stored.
+class DraftProfiler:
+    def __init__(self, sample_every=10, top_n=10):
+        self.sample_every = max(1, sample_every)
+        self.top_n = top_n
+        self.drafts = 0
+        self.stages = {}
+        self.samples = []
+        self._last_snapshot = None
+        self._last_rss_kb = None
+        self._started_tracing = False
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        # The first window starts now, even if tracing was already running
+        tracemalloc.reset_peak()
+        self._last_rss_kb = peak_rss_kb()
+
+    def stop(self):
+        if self._started_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._started_tracing = False
+        self._last_snapshot = None
+        self._last_rss_kb = None
+
+    @contextmanager
+    def stage(self, name):
+        before, _ = tracemalloc.get_traced_memory()
+        try:
+            yield
+        finally:
+            after, _ = tracemalloc.get_traced_memory()
+            entry = self.stages.setdefault(name, {"calls": 0, "net_bytes": 0, "max_net_bytes": 0})
+            entry["calls"] += 1
+            entry["net_bytes"] += after - before
+            entry["max_net_bytes"] = max(entry["max_net_bytes"], after - before)
+
+    def end_draft(self):
+        self.drafts += 1
+        if self.drafts % self.sample_every == 0:
+            self.sample()
+
+    def sample(self):
+        snapshot = tracemalloc.take_snapshot().filter_traces(_SNAPSHOT_FILTERS)
+        current, peak = tracemalloc.get_traced_memory()
+
+        top = [
+            {"location": str(stat.traceback), "size_bytes": stat.size, "count": stat.count}
+            for stat in snapshot.statistics('lineno')[:self.top_n]
+        ]
+        growth = []
+        if self._last_snapshot is not None:
+            growth = [
+                {"location": str(stat.traceback), "size_diff_bytes": stat.size_diff, "count_diff": stat.count_diff}
+                for stat in snapshot.compare_to(self._last_snapshot, 'lineno')[:self.top_n]
+            ]
+        self._last_snapshot = snapshot
+        # Start a new window so the next traced peak only covers the next N drafts
+        tracemalloc.reset_peak()
+
+        # ru_maxrss is a process-lifetime high-water mark, so track its growth too
+        rss = peak_rss_kb()
+        rss_delta = None
+        if rss is not None and self._last_rss_kb is not None:
+            rss_delta = rss - self._last_rss_kb
+        self._last_rss_kb = rss
+
+        self.samples.append({
+            "draft": self.drafts,
+            "traced_current_bytes": current,
+            "traced_window_peak_bytes": peak,
+            "peak_rss_kb": rss,
+            "peak_rss_delta_kb": rss_delta,
+            "top_allocations": top,
+            "growth_since_last_sample": growth,
+        })
+
+    def report(self):
+        return {
+            "drafts": self.drafts,
+            "sample_every": self.sample_every,
+            "stages": self.stages,
+            "samples": self.samples,
+        }
+
+    def export(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2, ensure_ascii=False)
@@ -1,5 +1,11 @@
 import random
+import os
 import json
+import hashlib
+import numpy as np
+from contextlib import nullcontext
+
+from draft_profiler import DraftProfiler
 
 # Configuration
 PACK_SIZE = 10
@@ -7,7 +13,11 @@ NUM_ROUNDS = 6
 DEFAULT_NUM_PLAYERS = 3
 CUBE_MD_PATH = 'cards/cube.md'
 CARDS_JSON_PATH = 'cards/cards.json'
+TIER_TABLE_PATH = 'cards/tier_table.npz'
+BOT_LOG_PATHS = ['bot_logs.json', 'bot_picks_log.json']  # written by the CLI and the UI
+SEAT_MODES = ('human', 'full', 'fast')
 _BOT_LOGS = []
+_PROFILER = None
 
 def initialize_bot_logs(num_players):
     global _BOT_LOGS
@@ -18,6 +28,26 @@ def get_bot_logs():
         raise RuntimeError("BOT_LOGS not initialized.")
     return _BOT_LOGS
 
+def enable_profiling(sample_every=10, top_n=10):
+    global _PROFILER
+    # Stop any previous profiler first so it releases tracemalloc
+    disable_profiling()
+    _PROFILER = DraftProfiler(sample_every=sample_every, top_n=top_n)
+    _PROFILER.start()
+    return _PROFILER
+
+def disable_profiling():
+    global _PROFILER
+    if _PROFILER is not None:
+        _PROFILER.stop()
+    _PROFILER = None
+
+def get_profiler():
+    return _PROFILER
+
+def _stage(name):
+    return _PROFILER.stage(name) if _PROFILER is not None else nullcontext()
+
 # Draft goals (used for evaluating picks)
 TARGET_STATS = {
     "amberControl": 10,
@@ -26,6 +56,25 @@ TARGET_STATS = {
     "creatureControl": 12
 }
 
+# Matchup model: weight of each deck AERC total in the strength score, and the
+# strength difference that corresponds to a ~73% win probability (logistic scale)
+MATCHUP_WEIGHTS = {
+    "amberControl": 1.0,
+    "expectedAmber": 1.0,
+    "creatureControl": 0.6,
+    "artifactControl": 0.4,
+    "efficiency": 0.5,
+    "recursion": 0.3
+}
+MATCHUP_SCALE = 4.0
+
+# Fast bot tier table: weight of the aggregate simulation pick rate (0-1) added to
+# the precomputed stat + synergy score of each card
+TIER_PICK_RATE_WEIGHT = 2.0
+# Share of fast picks shadow-scored by the full scorer when no full bot seat's
+# logged picks are available to replay for the agreement report
+SHADOW_SCORE_RATE = 0.1
+
 def parse_float(val):
     try:
         return float(val.replace(',', '.'))
@@ -99,9 +148,30 @@ def load_card_stats_from_json(json_path):
 
     return stats, house_map
 
-def bot_pick(pack, picked_cards, stats, house_map, bot_index):
+def house_commitment_multiplier(house_counts, house):
+    house_count = house_counts.get(house, 0)
+    if len(house_counts) < 3:
+        return 1.0  # No penalty early on
+    if house in house_counts:
+        if house_count > 12:
+            return 1 / (1.2 ** (house_count - 12))  # soften exponential
+        elif house_count == 11:
+            return 1.75
+        elif 9 <= house_count < 11:
+            return 1.5
+        elif 6 <= house_count < 9:
+            return 1.3
+        elif 3 <= house_count < 6:
+            return 1.1
+        return 1.0
+    return 0.5  # Discourage 4th house
+
+def score_pack(pack, picked_cards, stats, house_map):
+    # Full scorer without side effects: returns the best card (or None) and the
+    # score breakdown that bot_pick logs
     best_score = None
     best_card = None
+    best_details = {}
     house_counts = {}
     picked_traits = set()
     picked_cards_set = set(picked_cards)
@@ -122,9 +192,7 @@ def bot_pick(pack, picked_cards, stats, house_map, bot_index):
     for c in picked_cards:
         c_stats = stats.get(c, {})
         for k in TARGET_STATS:
-            current_stats[k] += c_stats.get(k, 0.0)
-
-    distinct_houses = len(house_counts)
+            current_stats[k] += c_stats.get(k) or 0.0
 
     # Step 3: Evaluate all cards in the pack
     for card in pack:
@@ -133,120 +201,342 @@ def bot_pick(pack, picked_cards, stats, house_map, bot_index):
         if not card_stats or not house:
             continue
 
-    ### --- 1. Trait Synergy Score ---
-    synergy_score = 0.0
-    for synergy in card_stats.get('synergies', []):
-        trait = synergy.get('trait')
-        rating = synergy.get('rating', 0)
-        house_condition = synergy.get('house', 'anyHouse')
-
-        if trait in picked_traits:
-            valid = (
-                house_condition == 'anyHouse' or
-                (house_condition == 'house' and house == house_map.get(card)) or
-                (house_condition == 'outOfHouse' and house != house_map.get(card))
-            )
-            if valid:
-                synergy_score += rating * 1.0  # Weight stays the same
-
-    ### --- 2. Direct Combo Score ---
-    combo_bonus = 0.0
-    for combo_card in card_stats.get('comboWith', []):
-        if combo_card in picked_cards_set:
-            combo_info = stats.get(combo_card, {})
-            house_condition = combo_info.get('house', 'anyHouse')  # fallback
-            valid = (
-                house_condition == 'anyHouse' or
-                (house_condition == 'house' and house == house_map.get(combo_card)) or
-                (house_condition == 'outOfHouse' and house != house_map.get(combo_card))
-            )
-            if valid:
-                combo_bonus += 2.0  # Still tunable
-
-    ### --- 2b. Potential Future Combo Score ---
-    future_combo_bonus = 0.0
-    for picked in picked_cards:
-        picked_stats = stats.get(picked, {})
-        for target in picked_stats.get('comboWith', []):
-            if target == card:
-                house_condition = picked_stats.get('house', 'anyHouse')
+        ### --- 1. Trait Synergy Score ---
+        synergy_score = 0.0
+        for synergy in card_stats.get('synergies', []):
+            trait = synergy.get('trait')
+            rating = synergy.get('rating', 0)
+            house_condition = synergy.get('house', 'anyHouse')
+
+            if trait in picked_traits:
                 valid = (
                     house_condition == 'anyHouse' or
-                    (house_condition == 'house' and house == house_map.get(picked)) or
-                    (house_condition == 'outOfHouse' and house != house_map.get(picked))
+                    (house_condition == 'house' and house == house_map.get(card)) or
+                    (house_condition == 'outOfHouse' and house != house_map.get(card))
                 )
                 if valid:
-                    future_combo_bonus += 1.0
-
-    ### --- 3. House Commitment Multiplier ---
-    house_count = house_counts.get(house, 0)
-    if distinct_houses < 3:
-        house_multiplier = 1.0  # No penalty early on
-    elif house in house_counts:
-        if house_count > 12:
-            house_multiplier = 1 / (1.2 ** (house_count - 12))  # soften exponential
-        elif house_count == 11:
-            house_multiplier = 1.75
-        elif 9 <= house_count < 11:
-            house_multiplier = 1.5
-        elif 6 <= house_count < 9:
-            house_multiplier = 1.3
-        elif 3 <= house_count < 6:
-            house_multiplier = 1.1
+                    synergy_score += rating * 1.0  # Weight stays the same
+
+        ### --- 2. Direct Combo Score ---
+        combo_bonus = 0.0
+        for combo_card in card_stats.get('comboWith', []):
+            if combo_card in picked_cards_set:
+                combo_info = stats.get(combo_card, {})
+                house_condition = combo_info.get('house', 'anyHouse')  # fallback
+                valid = (
+                    house_condition == 'anyHouse' or
+                    (house_condition == 'house' and house == house_map.get(combo_card)) or
+                    (house_condition == 'outOfHouse' and house != house_map.get(combo_card))
+                )
+                if valid:
+                    combo_bonus += 2.0  # Still tunable
+
+        ### --- 2b. Potential Future Combo Score ---
+        future_combo_bonus = 0.0
+        for picked in picked_cards:
+            picked_stats = stats.get(picked, {})
+            for target in picked_stats.get('comboWith', []):
+                if target == card:
+                    house_condition = picked_stats.get('house', 'anyHouse')
+                    valid = (
+                        house_condition == 'anyHouse' or
+                        (house_condition == 'house' and house == house_map.get(picked)) or
+                        (house_condition == 'outOfHouse' and house != house_map.get(picked))
+                    )
+                    if valid:
+                        future_combo_bonus += 1.0
+
+        ### --- 3. House Commitment Multiplier ---
+        house_multiplier = house_commitment_multiplier(house_counts, house)
+
+        ### --- 4. Stat-Based Score ---
+        stat_score = 0.0
+        unmet_goals = any(current_stats[k] < TARGET_STATS[k] for k in TARGET_STATS)
+
+        if unmet_goals:
+            for k in TARGET_STATS:
+                if current_stats[k] < TARGET_STATS[k]:
+                    stat_score += 0.1 * (TARGET_STATS[k] - current_stats[k]) * (card_stats.get(k) or 0.0)
         else:
-            house_multiplier = 1.0
-    else:
-        house_multiplier = 0.5  # Discourage 4th house
+            stat_score += 0.05 * (card_stats.get('efficiency') or 0.0)
+            stat_score += 0.03 * (card_stats.get('recursion') or 0.0)
+            stat_score += 0.02 * (card_stats.get('creatureControl') or 0.0)
+
+        ### --- 5. Final Score ---
+        total_score = (synergy_score + combo_bonus + future_combo_bonus) * house_multiplier + stat_score
+
+        if best_score is None or total_score > best_score:
+            best_score = total_score
+            best_card = card
+            best_details = {
+                "synergy_score": synergy_score,
+                "combo_bonus": combo_bonus,
+                "future_combo_bonus": future_combo_bonus,
+                "house_multiplier": house_multiplier,
+                "stat_score": stat_score,
+                "card_house": house,
+            }
+
+    return best_card, {
+        "score": best_score,
+        "house_counts": dict(house_counts),
+        "current_stats": current_stats,
+        **best_details,
+    }
 
-    ### --- 4. Stat-Based Score ---
-    stat_score = 0.0
-    unmet_goals = any(current_stats[k] < TARGET_STATS[k] for k in TARGET_STATS)
+def bot_pick(pack, picked_cards, stats, house_map, bot_index):
+    best_card, details = score_pack(pack, picked_cards, stats, house_map)
+    chosen_card = best_card or random.choice(pack)
 
-    if unmet_goals:
-        for k in TARGET_STATS:
-            if current_stats[k] < TARGET_STATS[k]:
-                stat_score += 0.1 * (TARGET_STATS[k] - current_stats[k]) * card_stats.get(k, 0.0)
-    else:
-        stat_score += 0.05 * card_stats.get('efficiency', 0.0)
-        stat_score += 0.03 * card_stats.get('recursion', 0.0)
-        stat_score += 0.02 * card_stats.get('creatureControl', 0.0)
+    ### --- 6. Log the pick ---
+    with _stage("bot_log"):
+        get_bot_logs()[bot_index].append({
+            "pick_num": len(picked_cards) + 1,
+            "pack": pack.copy(),
+            "picked_cards": picked_cards.copy(),
+            "chosen_card": chosen_card,
+            **details,
+        })
+
+    return chosen_card
+
+def pick_rate_counts(bot_logs):
+    # Only full-scorer picks log the pack they were made from; fast picks are
+    # skipped so the table does not reinforce its own choices
+    seen = {}
+    chosen = {}
+    for seat_log in bot_logs or []:
+        for entry in seat_log:
+            if entry.get('mode') == 'fast' or 'pack' not in entry:
+                continue
+            for c in entry['pack']:
+                seen[c] = seen.get(c, 0) + 1
+            c = entry.get('chosen_card')
+            if c:
+                chosen[c] = chosen.get(c, 0) + 1
+    return seen, chosen
+
+def load_bot_logs(paths=BOT_LOG_PATHS):
+    # Concatenate the per-seat logs of every saved draft that exists on disk
+    bot_logs = []
+    for path in paths:
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                bot_logs.extend(json.load(f))
+    return bot_logs
+
+def tier_table_fingerprint(stats, house_map, card_pool, bot_logs=None):
+    # Hash of every input build_tier_table reads, used to detect a stale cache
+    copies = {}
+    for c in card_pool:
+        copies[c] = copies.get(c, 0) + 1
+    source = {
+        'pool': sorted(copies.items()),
+        'cards': {c: [house_map.get(c), stats.get(c)] for c in sorted(copies)},
+        'pick_rates': [sorted(counts.items()) for counts in pick_rate_counts(bot_logs)],
+        'target_stats': TARGET_STATS,
+        'pick_rate_weight': TIER_PICK_RATE_WEIGHT,
+    }
+    return hashlib.sha256(json.dumps(source, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+def build_tier_table(stats, house_map, card_pool, bot_logs=None):
+    # Precompute one score per card and per house context: column h assumes the
+    # drafter's main house is houses[h], the last column is the uncommitted case.
+    titles = sorted({c for c in card_pool if house_map.get(c) and stats.get(c)})
+    houses = sorted({house_map[c] for c in titles})
+    house_index = {h: i for i, h in enumerate(houses)}
+
+    # Share of the pool (by copies) carrying each trait, per house and overall
+    trait_index = {}
+    copies = {}
+    for c in card_pool:
+        copies[c] = copies.get(c, 0) + 1
+    for title in titles:
+        for trait in stats[title].get('traits', []):
+            t = trait.get('trait')
+            if t and t not in trait_index:
+                trait_index[t] = len(trait_index)
+    trait_share = np.zeros((len(houses) + 1, len(trait_index)))
+    house_totals = np.zeros(len(houses) + 1)
+    for title in titles:
+        h = house_index[house_map[title]]
+        house_totals[h] += copies[title]
+        for trait in stats[title].get('traits', []):
+            t = trait.get('trait')
+            if t:
+                trait_share[h, trait_index[t]] += copies[title]
+    house_totals[-1] = house_totals[:-1].sum()
+    trait_share[-1] = trait_share[:-1].sum(axis=0)
+    trait_share /= np.maximum(house_totals, 1)[:, None]
+
+    # Aggregate pick rate (times chosen / times seen) from previous simulations
+    seen, chosen = pick_rate_counts(bot_logs)
+
+    scores = np.zeros((len(titles), len(houses) + 1), dtype=np.float32)
+    for row, title in enumerate(titles):
+        card_stats = stats[title]
+        card_house = house_map[title]
+
+        # Mid-draft stat score: goals assumed half met, plus the late-draft extras
+        stat_score = sum(0.05 * TARGET_STATS[k] * (card_stats.get(k) or 0.0) for k in TARGET_STATS)
+        stat_score += 0.05 * (card_stats.get('efficiency') or 0.0)
+        stat_score += 0.03 * (card_stats.get('recursion') or 0.0)
+        if title in seen:
+            stat_score += TIER_PICK_RATE_WEIGHT * chosen.get(title, 0) / seen[title]
+
+        for col in range(len(houses) + 1):
+            context_house = houses[col] if col < len(houses) else None
+            synergy_score = 0.0
+            for synergy in card_stats.get('synergies', []):
+                t = trait_index.get(synergy.get('trait'))
+                if t is None:
+                    continue
+                house_condition = synergy.get('house', 'anyHouse')
+                if house_condition == 'house':
+                    share = trait_share[house_index[card_house], t]
+                elif house_condition == 'outOfHouse' and context_house is not None:
+                    share = trait_share[house_index[context_house], t] if context_house != card_house else 0.0
+                else:
+                    share = trait_share[col, t]
+                synergy_score += (synergy.get('rating') or 0) * share
+            scores[row, col] = synergy_score + stat_score
+
+    return {
+        'titles': np.array(titles, dtype=str),
+        'houses': np.array(houses, dtype=str),
+        'scores': scores,
+        'index': {t: i for i, t in enumerate(titles)},
+        'house_index': house_index,
+        'fingerprint': tier_table_fingerprint(stats, house_map, card_pool, bot_logs),
+    }
+
+def save_tier_table(tier_table, path):
+    np.savez_compressed(
+        path,
+        titles=tier_table['titles'],
+        houses=tier_table['houses'],
+        scores=tier_table['scores'],
+        fingerprint=np.array(tier_table['fingerprint'], dtype=str),
+    )
+
+def load_tier_table(path):
+    with np.load(path) as data:
+        titles = data['titles']
+        houses = data['houses']
+        scores = data['scores']
+        fingerprint = str(data['fingerprint']) if 'fingerprint' in data else None
+    return {
+        'titles': titles,
+        'houses': houses,
+        'scores': scores,
+        'index': {str(t): i for i, t in enumerate(titles)},
+        'house_index': {str(h): i for i, h in enumerate(houses)},
+        'fingerprint': fingerprint,
+    }
+
+def fast_score_pack(pack, picked_cards, tier_table, house_map):
+    house_counts = {}
+    for c in picked_cards:
+        h = house_map.get(c)
+        if h:
+            house_counts[h] = house_counts.get(h, 0) + 1
 
-    ### --- 5. Final Score ---
-    total_score = (synergy_score + combo_bonus + future_combo_bonus) * house_multiplier + stat_score
+    # Context column: the drafter's most picked house, or uncommitted
+    scores = tier_table['scores']
+    col = scores.shape[1] - 1
+    if house_counts:
+        main_house = max(house_counts, key=house_counts.get)
+        col = tier_table['house_index'].get(main_house, col)
+
+    best_score = None
+    best_card = None
+    for card in pack:
+        row = tier_table['index'].get(card)
+        if row is None:
+            continue
+        score = float(scores[row, col]) * house_commitment_multiplier(house_counts, house_map.get(card))
+        if best_score is None or score > best_score:
+            best_score = score
+            best_card = card
 
-    if best_score is None or total_score > best_score:
-        best_score = total_score
-        best_card = card
+    return best_card, best_score, house_counts
 
+def fast_bot_pick(pack, picked_cards, tier_table, house_map, bot_index, stats=None):
+    best_card, best_score, house_counts = fast_score_pack(pack, picked_cards, tier_table, house_map)
     chosen_card = best_card or random.choice(pack)
 
-    ### --- 6. Log the pick ---
-    get_bot_logs()[bot_index].append({
-        "pick_num": len(picked_cards) + 1,
-        "pack": pack.copy(),
-        "picked_cards": picked_cards.copy(),
-        "chosen_card": chosen_card,
-        "score": best_score,
-        "house_counts": dict(house_counts),
-        "current_stats": current_stats,
-        "synergy_score": synergy_score,
-        "combo_bonus": combo_bonus,
-        "future_combo_bonus": future_combo_bonus,
-        "house_multiplier": house_multiplier,
-        "stat_score": stat_score,
-        "card_house": house,
-    })
-
-    return chosen_card or random.choice(pack)
+    # With stats, shadow-score the pick with the full scorer for the agreement report
+    full_card = score_pack(pack, picked_cards, stats, house_map)[0] if stats is not None else None
 
-def run_draft(card_pool, house_map, stats, num_players):
+    with _stage("bot_log"):
+        entry = {
+            "mode": "fast",
+            "pick_num": len(picked_cards) + 1,
+            "chosen_card": chosen_card,
+            "score": best_score,
+            "house_counts": house_counts,
+        }
+        if stats is not None:
+            entry["full_card"] = full_card
+        get_bot_logs()[bot_index].append(entry)
+
+    return chosen_card
+
+def fast_pick_agreement(bot_logs, tier_table, house_map):
+    # Share of picks where the fast mode and the full scorer choose the same card:
+    # shadow-scored fast picks are compared directly, full-scorer picks are replayed
+    total = 0
+    agreed = 0
+    for seat_log in bot_logs:
+        for entry in seat_log:
+            if entry.get('mode') == 'fast':
+                if 'full_card' not in entry:
+                    continue
+                total += 1
+                agreed += entry['full_card'] == entry['chosen_card']
+            elif 'pack' in entry:
+                fast_card, _, _ = fast_score_pack(entry['pack'], entry['picked_cards'], tier_table, house_map)
+                total += 1
+                agreed += fast_card == entry['chosen_card']
+    return agreed / total if total else None
+
+def load_or_build_tier_table(stats, house_map, card_pool, bot_logs=None, path=TIER_TABLE_PATH):
+    # Reuse the cached table only if it was built from the same pool, stats and logs
+    if os.path.exists(path):
+        tier_table = load_tier_table(path)
+        if tier_table['fingerprint'] == tier_table_fingerprint(stats, house_map, card_pool, bot_logs):
+            return tier_table
+    tier_table = build_tier_table(stats, house_map, card_pool, bot_logs)
+    save_tier_table(tier_table, path)
+    return tier_table
+
+def parse_fast_seats(text, num_players):
+    # "2,3" -> {2, 3}; seat 1 is the human, so only seats 2..num_players are valid
+    try:
+        fast_seats = {int(s) for s in text.split(',') if s.strip()}
+    except ValueError:
+        raise ValueError(f"Fast bot seats must be comma separated numbers, got '{text}'.")
+    invalid = sorted(s for s in fast_seats if s < 2 or s > num_players)
+    if invalid:
+        raise ValueError(f"Fast bot seats must be between 2 and {num_players}, got {invalid}.")
+    return fast_seats
+
+def run_draft(card_pool, house_map, stats, num_players, seat_modes=None, tier_table=None, shadow_rate=0.0):
     total_packs = num_players * NUM_ROUNDS
     if len(card_pool) < total_packs * PACK_SIZE:
         raise ValueError("Not enough cards to run full draft.")
 
-    random.shuffle(card_pool)
-    packs = [[card_pool.pop() for _ in range(PACK_SIZE)] for _ in range(total_packs)]
-    players = [[] for _ in range(num_players)]
+    if seat_modes is None:
+        seat_modes = ['human'] + ['full'] * (num_players - 1)
+    if len(seat_modes) != num_players or any(m not in SEAT_MODES for m in seat_modes):
+        raise ValueError(f"seat_modes must list one of {SEAT_MODES} per player.")
+    if 'fast' in seat_modes and tier_table is None:
+        raise ValueError("Fast bot seats require a tier table.")
+
+    with _stage("deal_packs"):
+        random.shuffle(card_pool)
+        packs = [[card_pool.pop() for _ in range(PACK_SIZE)] for _ in range(total_packs)]
+        players = [[] for _ in range(num_players)]
 
     for round_index in range(NUM_ROUNDS):
         round_packs = [packs[round_index * num_players + i] for i in range(num_players)]
@@ -257,7 +547,7 @@ def run_draft(card_pool, house_map, stats, num_players):
                 current_index = (i + pick_num * direction) % num_players
                 pack = round_packs[current_index]
 
-                if i == 0:
+                if seat_modes[i] == 'human':
                     print(f"--- Your pack (Pick {pick_num+1}, Round {round_index+1}) ---")
                     for idx, card in enumerate(pack):
                         print(f"{idx+1}: [{house_map.get(card)}] {card}")
@@ -270,13 +560,74 @@ def run_draft(card_pool, house_map, stats, num_players):
                                 break
                         except:
                             pass
+                elif seat_modes[i] == 'fast':
+                    with _stage("fast_bot_pick"):
+                        shadow = random.random() < shadow_rate
+                        pick = fast_bot_pick(pack, players[i], tier_table, house_map, i, stats if shadow else None)
+                        pack.remove(pick)
+                        players[i].append(pick)
                 else:
-                    pick = bot_pick(pack, players[i], stats, house_map, i)
-                    pack.remove(pick)
-                    players[i].append(pick)
+                    with _stage("bot_pick"):
+                        pick = bot_pick(pack, players[i], stats, house_map, i)
+                        pack.remove(pick)
+                        players[i].append(pick)
+
+    if _PROFILER is not None:
+        _PROFILER.end_draft()
 
     return players
 
+def build_stat_table(stats):
+    # Title -> row lookup over the MATCHUP_WEIGHTS stats, built once per cube. The
+    # extra last row is all zeros and pads short decks / unknown cards.
+    keys = list(MATCHUP_WEIGHTS)
+    titles = list(stats)
+    values = np.array([[stats[t].get(k) or 0.0 for k in keys] for t in titles], dtype=float)
+    return {
+        'index': {t: i for i, t in enumerate(titles)},
+        'values': np.vstack([values.reshape(-1, len(keys)), np.zeros((1, len(keys)))]),
+    }
+
+def deck_index_matrix(players, stat_table):
+    # (num_players, max_picks) row indices into stat_table['values']; index
+    # matrices of several drafts can be stacked into a batch
+    pad = len(stat_table['values']) - 1
+    width = max((len(picks) for picks in players), default=0)
+    rows = np.full((len(players), width), pad, dtype=np.intp)
+    for i, picks in enumerate(players):
+        rows[i, :len(picks)] = [stat_table['index'].get(c, pad) for c in picks]
+    return rows
+
+def deck_stat_matrix(players, stats, stat_table=None):
+    # One row per seat, one column per MATCHUP_WEIGHTS key (summed over the deck)
+    if stat_table is None:
+        stat_table = build_stat_table(stats)
+    return stat_table['values'][deck_index_matrix(players, stat_table)].sum(axis=-2)
+
+def estimate_matchups(deck_stats):
+    # deck_stats: (..., num_players, num_stats) -> (..., num_players, num_players)
+    # Entry [i, j] is the probability that seat i beats seat j. Leading axes are
+    # broadcast, so a whole batch of simulated drafts can be scored at once.
+    weights = np.array(list(MATCHUP_WEIGHTS.values()))
+    strength = np.asarray(deck_stats, dtype=float) @ weights
+    diff = strength[..., :, None] - strength[..., None, :]
+    return 1.0 / (1.0 + np.exp(-diff / MATCHUP_SCALE))
+
+def display_matchups(players, stats):
+    win_matrix = estimate_matchups(deck_stat_matrix(players, stats))
+    num_players = len(players)
+    print("=== Estimated Matchups (row beats column) ===")
+    print("         " + "".join(f"P{j+1:<6}" for j in range(num_players)))
+    for i in range(num_players):
+        row = "".join("  -    " if i == j else f"{win_matrix[i, j]:<7.2f}" for j in range(num_players))
+        print(f"Player {i+1} {row}")
+    # Diagonal is always 0.5, so drop it from the round-robin average
+    if num_players > 1:
+        expected = (win_matrix.sum(axis=1) - 0.5) / (num_players - 1)
+        for i in np.argsort(-expected):
+            print(f"Player {i+1}: expected round-robin win rate {expected[i]:.1%}")
+    return win_matrix
+
 def display_drafts(players, house_map):
     for i, picks in enumerate(players):
         print(f"=== Player {i+1} Picks ===")
@@ -296,8 +647,26 @@ if __name__ == '__main__':
         num_players = input(f"Enter number of players (default {DEFAULT_NUM_PLAYERS}): ").strip()
         num_players = int(num_players) if num_players else DEFAULT_NUM_PLAYERS
 
-        players = run_draft(card_pool, house_map, stats, num_players)
+        while True:
+            try:
+                fast_seats = parse_fast_seats(input(f"Fast bot seats, e.g. 2,3 (2-{num_players}, blank for none): "), num_players)
+                break
+            except ValueError as e:
+                print(e)
+        seat_modes = ['human'] + ['fast' if i + 1 in fast_seats else 'full' for i in range(1, num_players)]
+        tier_table = load_or_build_tier_table(stats, house_map, card_pool, load_bot_logs()) if fast_seats else None
+        # Agreement replays the full bots' picks; only sample shadow scores without any
+        shadow_rate = SHADOW_SCORE_RATE if fast_seats and 'full' not in seat_modes else 0.0
+
+        initialize_bot_logs(num_players)
+        players = run_draft(card_pool, house_map, stats, num_players, seat_modes, tier_table, shadow_rate)
         display_drafts(players, house_map)
+        display_matchups(players, stats)
+
+        if tier_table is not None:
+            agreement = fast_pick_agreement(_BOT_LOGS, tier_table, house_map)
+            if agreement is not None:
+                print(f"Fast bot pick agreement with full scorer: {agreement:.1%}")
 
         with open("bot_logs.json", "w", encoding="utf-8") as f:
             json.dump(_BOT_LOGS, f, indent=2, ensure_ascii=False)
@@ -3,12 +3,19 @@ from tkinter import messagebox
 from PIL import Image, ImageTk
 import os
 import json
+import random
 
 from draft_simulator import (
     load_cube_md,
     load_card_stats_from_json,
     build_card_pool,
     bot_pick,
+    fast_bot_pick,
+    fast_pick_agreement,
+    load_or_build_tier_table,
+    load_bot_logs,
+    parse_fast_seats,
+    SHADOW_SCORE_RATE,
     PACK_SIZE,
     NUM_ROUNDS,
     CUBE_MD_PATH,
@@ -33,6 +40,11 @@ class DraftUI:
         self.stats, self.house_map = load_card_stats_from_json(CARDS_JSON_PATH)
 
         self.num_players = self.prompt_player_count()
+        fast_seats = getattr(self, '_fast_seats', set())
+        self.seat_modes = ['human'] + ['fast' if i + 1 in fast_seats else 'full' for i in range(1, self.num_players)]
+        self.tier_table = load_or_build_tier_table(self.stats, self.house_map, self.card_pool, load_bot_logs()) if fast_seats else None
+        # Agreement replays the full bots' picks; only sample shadow scores without any
+        self.shadow_rate = SHADOW_SCORE_RATE if fast_seats and 'full' not in self.seat_modes else 0.0
         self.players = [[] for _ in range(self.num_players)]
         self.total_packs = self.num_players * NUM_ROUNDS
 
@@ -65,6 +77,7 @@ class DraftUI:
                 val = int(entry.get())
                 if val < 3 or val > max_players:
                     raise ValueError
+                self._fast_seats = parse_fast_seats(fast_entry.get(), val)
                 count_window.destroy()
                 self.root.deiconify()
                 self.root.lift()
@@ -72,16 +85,19 @@ class DraftUI:
                 self.root.update()
                 return val
             except:
-                messagebox.showerror("Invalid Input", f"Enter a number between 3 and {max_players}.")
+                messagebox.showerror("Invalid Input", f"Enter a number between 3 and {max_players}, and fast bot seats between 2 and the number of players.")
 
         self.root.withdraw()
         count_window = tk.Toplevel()
-        count_window.geometry("300x150")
+        count_window.geometry("300x210")
         count_window.title("Number of Players")
         tk.Label(count_window, text=f"Enter number of players (3–{self._max_players}):").pack(padx=10, pady=10)
         entry = tk.Entry(count_window)
         entry.pack(padx=10)
         entry.insert(0, str(DEFAULT_NUM_PLAYERS))
+        tk.Label(count_window, text="Fast bot seats, e.g. 2,3 (blank for none):").pack(padx=10, pady=(10, 0))
+        fast_entry = tk.Entry(count_window)
+        fast_entry.pack(padx=10)
         tk.Button(count_window, text="Start", command=lambda: setattr(self, '_player_count', submit())).pack(pady=10)
         self.root.wait_window(count_window)
         return getattr(self, '_player_count', DEFAULT_NUM_PLAYERS)
@@ -191,7 +207,11 @@ class DraftUI:
 
         for i in range(1, self.num_players):
             bot_pack = self.packs[self.round_index * self.num_players + ((i + self.pick_num * self.direction) % self.num_players)]
-            bot_pick_result = bot_pick(bot_pack, self.players[i], self.stats, self.house_map, i)
+            if self.seat_modes[i] == 'fast':
+                shadow_stats = self.stats if random.random() < self.shadow_rate else None
+                bot_pick_result = fast_bot_pick(bot_pack, self.players[i], self.tier_table, self.house_map, i, shadow_stats)
+            else:
+                bot_pick_result = bot_pick(bot_pack, self.players[i], self.stats, self.house_map, i)
             
             # Debugging: check if bot picked unknown card
             house = self.house_map.get(bot_pick_result, "Unknown")
@@ -288,6 +308,10 @@ class DraftUI:
         self.end_window = tk.Toplevel(self.root)
         self.end_window.title("Draft Complete")
         tk.Label(self.end_window, text="Draft complete! What would you like to do?").pack(padx=10, pady=10)
+        if self.tier_table is not None:
+            agreement = fast_pick_agreement(get_bot_logs(), self.tier_table, self.house_map)
+            if agreement is not None:
+                tk.Label(self.end_window, text=f"Fast bot pick agreement with full scorer: {agreement:.1%}").pack(padx=10)
         export_btn = tk.Button(self.end_window, text="Export JSON", command=export_json)
         export_btn.pack(pady=5)
         if self.exported: